@@ -0,0 +1,43 @@
+"""Add unique index on user email
+
+Revision ID: 0058d9807638
+Revises: be4b8be10f65
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0058d9807638'
+down_revision: Union[str, Sequence[str], None] = 'be4b8be10f65'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_auth_user_email'),
+            'user',
+            ['email'],
+            unique=True,
+            schema='auth',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix_auth_user_email'),
+            table_name='user',
+            schema='auth',
+            postgresql_concurrently=True,
+        )
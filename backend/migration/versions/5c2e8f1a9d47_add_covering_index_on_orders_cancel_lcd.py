@@ -0,0 +1,72 @@
+"""Add covering index on orders (is_cancel, last_change_date)
+
+Revision ID: 5c2e8f1a9d47
+Revises: 0811fb2e1e46
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c2e8f1a9d47'
+down_revision: Union[str, Sequence[str], None] = '0811fb2e1e46'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_orders_cancel_lcd',
+            'orders',
+            ['is_cancel', 'last_change_date'],
+            unique=False,
+            schema='wb',
+            postgresql_include=['product_id', 'price_with_disc'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_orders_last_change_date',
+            table_name='orders',
+            schema='wb',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_orders_is_cancel',
+            table_name='orders',
+            schema='wb',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_orders_is_cancel',
+            'orders',
+            ['is_cancel'],
+            unique=False,
+            schema='wb',
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'idx_orders_last_change_date',
+            'orders',
+            ['last_change_date'],
+            unique=False,
+            schema='wb',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_orders_cancel_lcd',
+            table_name='orders',
+            schema='wb',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,69 @@
+"""
+Benchmark Argon2id cost parameters on the current machine.
+
+Hashes a sample password with every (time_cost, memory_cost, parallelism)
+combination and prints the median wall time, marking the combination closest
+to the target latency. Copy the chosen values into
+src/auth/utils/passwords.py; stored hashes are rehashed on the next login.
+
+Usage:
+    uv run python scripts/tune_argon2.py --target-ms 500
+"""
+import statistics
+import time
+from itertools import product
+
+import click
+from pwdlib.hashers.argon2 import Argon2Hasher
+from rich.console import Console
+from rich.table import Table
+
+
+TIME_COSTS = (1, 2, 3, 4, 6)
+MEMORY_COSTS = (19456, 32768, 65536, 131072)
+PARALLELISMS = (1, 2, 4)
+
+
+def measure(time_cost: int, memory_cost: int, parallelism: int, rounds: int) -> float:
+    """Return the median hashing time in milliseconds."""
+    hasher = Argon2Hasher(
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism,
+    )
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        hasher.hash("x" * 16)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+@click.command()
+@click.option("--target-ms", default=500.0, show_default=True, help="Desired hashing latency.")
+@click.option("--rounds", default=5, show_default=True, help="Hashes per combination.")
+def main(target_ms: float, rounds: int) -> None:
+    results = [
+        (t, m, p, measure(t, m, p, rounds))
+        for t, m, p in product(TIME_COSTS, MEMORY_COSTS, PARALLELISMS)
+    ]
+    best = min(results, key=lambda r: abs(r[3] - target_ms))
+
+    table = Table(title=f"Argon2id timings (target {target_ms:.0f} ms)")
+    for column in ("time_cost", "memory_cost (KiB)", "parallelism", "median ms"):
+        table.add_column(column, justify="right")
+    for row in results:
+        t, m, p, ms = row
+        style = "bold green" if row is best else None
+        table.add_row(str(t), str(m), str(p), f"{ms:.1f}", style=style)
+
+    console = Console()
+    console.print(table)
+    console.print(
+        f"Closest to target: time_cost={best[0]}, "
+        f"memory_cost={best[1]}, parallelism={best[2]} ({best[3]:.1f} ms)"
+    )
+
+
+if __name__ == "__main__":
+    main()
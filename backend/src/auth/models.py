@@ -18,7 +18,7 @@ class Role(enum.Enum):
 class User(Base):
     __table_args__ = {"schema": "auth"}
     id: Mapped[uuid_pk]
-    email: Mapped[str] = mapped_column(String(128), nullable=False)
+    email: Mapped[str] = mapped_column(String(128), nullable=False, unique=True, index=True)
     first_name: Mapped[str] = mapped_column(String(48), nullable=False)
     last_name: Mapped[str] = mapped_column(String(48), nullable=False)
     username: Mapped[str] = mapped_column(String(48), nullable=True)
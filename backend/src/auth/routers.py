@@ -7,16 +7,24 @@ for authentication.
 """
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from src.auth.mappers import user_to_read
 from src.auth.models import Role, User
 from src.auth.schemas import LoginForm, RegisterForm, UserRead
-from src.auth.utils.passwords import hash_password, verify_password
+from src.auth.utils.passwords import DUMMY_HASH, hash_password, verify_password
 from src.database import get_async_session
-from src.dependencies import AuthDep, DBSessionDep, RefreshDep, auth
+from src.dependencies import (
+    AuthDep,
+    DBSessionDep,
+    RefreshDep,
+    auth,
+    forget_request_tokens,
+    issue_token_pair,
+)
 
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -49,7 +57,12 @@ async def register(
     Raises:
         HTTPException 400: If user with provided email already exists.
     """
-    exists = await db.scalar(select(User).where(User.email == data.email))
+    exists = await db.scalar(
+        select(literal(1))
+        .select_from(User)
+        .where(User.email == data.email)
+        .limit(1)
+    )
     if exists:
         raise HTTPException(
             status.HTTP_400_BAD_REQUEST,
@@ -61,7 +74,7 @@ async def register(
         first_name=data.first_name,
         last_name=data.last_name,
         username=data.username,
-        hashed_password=hash_password(data.password),
+        hashed_password=await hash_password(data.password),
         is_active=True,
         role=Role.GUEST,
     )
@@ -69,8 +82,7 @@ async def register(
     await db.commit()
     await db.refresh(user)
 
-    access = auth.create_access_token(uid=str(user.id), fresh=True)
-    refresh = auth.create_refresh_token(uid=str(user.id))
+    access, refresh = issue_token_pair(str(user.id))
     auth.set_access_cookies(access, response)
     auth.set_refresh_cookies(refresh, response)
 
@@ -80,52 +92,69 @@ async def register(
 @router.post(
     "/login",
     status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
     summary="Вход (login)"
 )
 async def login(
     data: LoginForm,
-    response: Response,
     db: AsyncSession = Depends(get_async_session),
-):
+) -> Response:
     """
     Authenticate user and issue JWT tokens.
     
     Verifies user credentials and sets fresh access and refresh tokens
-    as HTTP-only cookies in the response.
+    as HTTP-only cookies in the response. Outdated password hashes are
+    upgraded within the request's own session.
     
     Args:
         data: Login form containing email and password.
-        response: FastAPI Response object for setting authentication cookies.
-        db: Database session for user lookup.
+        db: Database session for user lookup and hash upgrades.
     
     Returns:
-        None (204 No Content on success).
+        Empty 204 No Content response carrying the authentication cookies.
     
     Raises:
         HTTPException 401: If email or password is incorrect.
     """
-    user = await db.scalar(select(User).where(User.email == data.email))
-    if not user or not await verify_password(data.password, user.hashed_password):
+    row = (await db.execute(
+        select(User.id, User.hashed_password)
+        .where(User.email == data.email)
+        .limit(1)
+    )).first()
+    # Unknown emails still pay for a hash check so response timing does not
+    # reveal which accounts exist.
+    verified, new_hash = await verify_password(
+        data.password,
+        row.hashed_password if row else DUMMY_HASH,
+    )
+    if not row or not verified:
         raise HTTPException(
             status.HTTP_401_UNAUTHORIZED,
             detail="Неверный email или пароль",
         )
-    access = auth.create_access_token(uid=str(user.id), fresh=True)
-    refresh = auth.create_refresh_token(uid=str(user.id))
+
+    if new_hash:
+        await db.execute(
+            update(User)
+            .where(User.id == row.id)
+            .values(hashed_password=new_hash)
+        )
+        await db.commit()
+
+    access, refresh = issue_token_pair(str(row.id))
+    response = Response(status_code=status.HTTP_204_NO_CONTENT)
     auth.set_access_cookies(access, response)
     auth.set_refresh_cookies(refresh, response)
-    return
+    return response
 
 
 @router.post(
     "/refresh",
     status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
     summary="Обновить access‑токен"
 )
-async def refresh_token(
-    response: Response,
-    payload: RefreshDep,
-):
+async def refresh_token(payload: RefreshDep) -> Response:
     """
     Issue new access token using valid refresh token.
     
@@ -133,24 +162,27 @@ async def refresh_token(
     and refresh tokens, updating the authentication cookies.
     
     Args:
-        response: FastAPI Response object for setting updated cookies.
         payload: Decoded refresh token payload containing user ID.
     
     Returns:
-        None (204 No Content on success).
+        Empty 204 No Content response carrying the updated cookies.
     
     Raises:
         HTTPException 401: If refresh token is invalid or expired (handled by RefreshDep).
     """
-    new_access = auth.create_access_token(uid=payload.sub, fresh=True)
-    refresh = auth.create_refresh_token(uid=str(payload.sub))
-    auth.set_access_cookies(new_access, response)
+    access, refresh = issue_token_pair(str(payload.sub))
+    response = Response(status_code=status.HTTP_204_NO_CONTENT)
+    auth.set_access_cookies(access, response)
     auth.set_refresh_cookies(refresh, response)
-    return
+    return response
 
 
-@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
-async def logout(response: Response) -> None:
+@router.post(
+    "/logout",
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
+)
+async def logout(request: Request) -> Response:
     """
     Log out user by clearing authentication cookies.
     
@@ -158,17 +190,21 @@ async def logout(response: Response) -> None:
     effectively logging out the user.
     
     Args:
-        response: FastAPI Response object for unsetting cookies.
+        request: Incoming request carrying the tokens to forget.
     
     Returns:
-        None (204 No Content).
+        Empty 204 No Content response that clears the cookies.
     
     Note:
-        This only clears cookies on the client side. Tokens remain valid
-        until expiration if stored elsewhere.
+        This only clears cookies on the client side and drops the tokens
+        from the in-process payload cache. Tokens remain valid until
+        expiration if stored elsewhere.
     """
+    forget_request_tokens(request)
+    response = Response(status_code=status.HTTP_204_NO_CONTENT)
     auth.unset_access_cookies(response)
     auth.unset_refresh_cookies(response)
+    return response
 
 
 @router.get("/users", response_model=UserRead)
@@ -192,13 +228,20 @@ async def get_user(
     Raises:
         HTTPException 401: If user is not found in database or token is invalid.
     """
-    user_id = UUID(payload.sub)
-    stmt = (
-        select(User)
-        .where(User.id == user_id)
+    user: User | None = await db_session.get(
+        User,
+        UUID(payload.sub),
+        options=[
+            load_only(
+                User.id,
+                User.email,
+                User.first_name,
+                User.last_name,
+                User.username,
+                User.role,
+            )
+        ],
     )
-
-    user: User | None = (await db_session.execute(stmt)).scalars().first()
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
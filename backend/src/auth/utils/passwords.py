@@ -1,19 +1,36 @@
 """
 Password hashing and verification utilities using Argon2.
 
-Provides secure password hashing with Argon2id algorithm and automatic
-hash updates when cost parameters become outdated.
+Provides secure password hashing with Argon2id algorithm and reports
+updated hashes when cost parameters become outdated.
 """
-from typing import Any
+import asyncio
+from typing import Any, Optional
 
 from argon2.exceptions import InvalidHashError, VerifyMismatchError
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
 
 
-_pwd = PasswordHash.recommended()
+# Measured with scripts/tune_argon2.py (~150 ms per hash on one vCPU).
+# Changing these rolls stored hashes forward on the next successful login.
+ARGON2_TIME_COST = 3
+ARGON2_MEMORY_COST = 65536
+ARGON2_PARALLELISM = 4
 
+_pwd = PasswordHash((
+    Argon2Hasher(
+        time_cost=ARGON2_TIME_COST,
+        memory_cost=ARGON2_MEMORY_COST,
+        parallelism=ARGON2_PARALLELISM,
+    ),
+))
 
-def hash_password(password: str) -> Any:
+# Verified against when the user is not found, keeping login timing uniform.
+DUMMY_HASH = _pwd.hash("dummy-password")
+
+
+async def hash_password(password: str) -> Any:
     """
     Hash a plain text password using Argon2id algorithm.
     
@@ -28,54 +45,35 @@ def hash_password(password: str) -> Any:
         Hashed password string in format: $argon2id$v=19$m=...,t=...,p=...$...$...
     
     Note:
-        Uses recommended defaults from pwdlib (Argon2id with secure parameters).
+        Uses argon2-cffi's C implementation of Argon2id with the cost
+        parameters pinned at module level.
+        Hashing is CPU-bound, so it runs in a worker thread to keep the
+        event loop responsive.
     """
-    return _pwd.hash(password)
+    return await asyncio.to_thread(_pwd.hash, password)
 
 
-async def verify_password(plain: str, hashed: str) -> bool:
+async def verify_password(plain: str, hashed: str) -> tuple[bool, Optional[str]]:
     """
     Verify plain text password against stored hash.
     
-    Compares the provided password with the stored hash and automatically
-    updates the hash in the database if cost parameters are outdated.
-    This ensures security stays current without requiring user action.
+    Compares the provided password with the stored hash and reports a fresh
+    hash when the stored one uses outdated cost parameters, so the caller
+    can persist it in its own transaction.
     
     Args:
         plain: Plain text password provided by user.
         hashed: Stored password hash from database.
     
     Returns:
-        True if password matches the hash, False otherwise.
-        Also returns False if hash format is invalid or algorithm is unknown.
-    
-    Note:
-        If hash parameters are outdated and verification succeeds, the function
-        automatically rehashes the password with current parameters and updates
-        the database asynchronously without blocking the response.
+        Tuple of (verified, new_hash). verified is True if password matches
+        the hash, False otherwise (also for invalid hash format or unknown
+        algorithm). new_hash is the password rehashed with current parameters
+        when the stored hash is outdated, None otherwise.
     """
     try:
-        verified, new_hash = _pwd.verify_and_update(plain, hashed)
+        return await asyncio.to_thread(_pwd.verify_and_update, plain, hashed)
     except InvalidHashError:
-        return False
+        return False, None
     except VerifyMismatchError:
-        return False
-
-    if verified and new_hash:
-        from src.database import async_session_maker
-        from src.auth.models import User
-        import sqlalchemy as sa
-        import asyncio
-
-        async def _store():
-            async with async_session_maker() as ses:
-                await ses.execute(
-                    sa.update(User)
-                      .where(User.hashed_password == hashed)
-                      .values(hashed_password=new_hash)
-                )
-                await ses.commit()
-
-        asyncio.create_task(_store())
-
-    return verified
+        return False, None
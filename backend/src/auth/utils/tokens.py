@@ -0,0 +1,85 @@
+"""
+In-process cache of verified JWT payloads.
+
+Access and refresh tokens live for minutes to days, yet every request
+re-checks the signature and re-validates the claims. Caching the decoded
+payload for a few seconds turns repeat verifications of the same cookie
+into a dictionary lookup.
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from authx import TokenPayload
+
+
+class TokenPayloadCache:
+    """
+    Bounded LRU cache of verified token payloads with a short TTL.
+
+    Entries are keyed by a BLAKE2b digest of the raw token, so the cache
+    never holds the token itself. An entry never outlives the token's own
+    expiry.
+
+    Attributes:
+        ttl: Maximum lifetime of an entry in seconds.
+        maxsize: Maximum number of cached payloads; least recently used
+            entries are evicted first.
+    """
+    def __init__(self, ttl: float = 15.0, maxsize: int = 4096) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, tuple[float, TokenPayload]] = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> Optional[TokenPayload]:
+        """
+        Return the cached payload for a token, or None if absent or stale.
+
+        Args:
+            token: Raw encoded JWT.
+        """
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, payload = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return payload
+
+    def set(self, token: str, payload: TokenPayload) -> None:
+        """
+        Store a verified payload for a token.
+
+        Args:
+            token: Raw encoded JWT that was just verified.
+            payload: Decoded payload returned by the verifier.
+        """
+        lifetime = min(self.ttl, payload.time_until_expiry.total_seconds())
+        if lifetime <= 0:
+            return
+
+        key = self._key(token)
+        self._entries[key] = (time.monotonic() + lifetime, payload)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def discard(self, token: Optional[str]) -> None:
+        """
+        Drop a token from the cache, e.g. on logout.
+
+        Args:
+            token: Raw encoded JWT; None is ignored.
+        """
+        if token:
+            self._entries.pop(self._key(token), None)
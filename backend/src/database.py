@@ -1,3 +1,4 @@
+import asyncio
 import re
 import uuid
 from datetime import datetime
@@ -7,6 +8,7 @@ from cryptography.fernet import Fernet
 from sqlalchemy import Dialect, func, TIMESTAMP
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncAttrs
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.orm import DeclarativeBase, declared_attr, Mapped, mapped_column
 
 from sqlalchemy.types import VARCHAR, TypeDecorator
@@ -15,10 +17,41 @@ from src.config import get_db_url, settings
 
 
 DATABASE_URL = get_db_url()
-
-engine = create_async_engine(DATABASE_URL)
+POOL_SIZE = 20
+POOL_MAX_OVERFLOW = 10
+
+engine = create_async_engine(
+    DATABASE_URL,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=POOL_SIZE,
+    max_overflow=POOL_MAX_OVERFLOW,
+    pool_pre_ping=True,
+)
 async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
+
+async def warm_up_pool(size: int = POOL_SIZE, timeout: float = 10.0) -> None:
+    """
+    Открывает `size` соединений при старте и возвращает их в пул,
+    чтобы первые запросы не платили за установку соединения.
+
+    Ожидание ограничено `timeout` секундами. При ошибке или таймауте
+    незавершённые подключения отменяются, а уже открытые соединения
+    всё равно закрываются (возвращаются в пул), чтобы ничего не утекло.
+    """
+    tasks = [asyncio.create_task(engine.connect().start()) for _ in range(size)]
+    try:
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout)
+    finally:
+        for task in tasks:
+            task.cancel()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.gather(
+            *(conn.close() for conn in results if not isinstance(conn, BaseException)),
+            return_exceptions=True,
+        )
+
+
 async def get_async_session():
     async with async_session_maker() as session:
         yield session
@@ -1,17 +1,90 @@
-from typing import Annotated
+from typing import Annotated, Awaitable, Callable, Literal
 
 from authx import AuthX, TokenPayload
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.models import User
+from src.auth.utils.tokens import TokenPayloadCache
 from src.config import authx_config
 from src.database import get_async_session
 
 
 auth = AuthX(config=authx_config, model=User)
+# One cache per token type: a hit skips authx's verify_type check, so an
+# entry verified as a refresh token must never satisfy an access dependency
+token_caches: dict[str, TokenPayloadCache] = {
+    "access": TokenPayloadCache(ttl=15.0),
+    "refresh": TokenPayloadCache(ttl=15.0),
+}
+
+
+def issue_token_pair(uid: str) -> tuple[str, str]:
+    """
+    Create a fresh access token and a refresh token for the same subject.
+
+    Args:
+        uid: Subject (user ID) to embed in both tokens.
+
+    Returns:
+        Tuple of (access_token, refresh_token).
+    """
+    return (
+        auth.create_access_token(uid=uid, fresh=True),
+        auth.create_refresh_token(uid=uid),
+    )
+
+
+def cached_token_required(
+    type: Literal["access", "refresh"],
+) -> Callable[[Request], Awaitable[TokenPayload]]:
+    """
+    Build a token dependency that memoizes authx verification results.
+
+    Looks the raw cookie token up in the ``token_caches`` entry for ``type``
+    first and only falls back to full authx verification (signature, claims,
+    token type) on a miss. Only tokens verified as ``type`` are ever cached
+    there.
+
+    Args:
+        type: Token type to require, "access" or "refresh".
+
+    Returns:
+        FastAPI dependency resolving to the verified TokenPayload.
+    """
+    verify = auth.token_required(type=type, verify_type=True)
+    cache = token_caches[type]
+    cookie_name = (
+        authx_config.JWT_ACCESS_COOKIE_NAME
+        if type == "access"
+        else authx_config.JWT_REFRESH_COOKIE_NAME
+    )
+
+    async def _token_required(request: Request) -> TokenPayload:
+        token = request.cookies.get(cookie_name)
+        if token:
+            payload = cache.get(token)
+            if payload is not None:
+                return payload
+
+        payload = await verify(request)
+        if token:
+            cache.set(token, payload)
+        return payload
+
+    return _token_required
+
+
+access_token_required = cached_token_required("access")
+refresh_token_required = cached_token_required("refresh")
+
+
+def forget_request_tokens(request: Request) -> None:
+    """Evict the request's access and refresh tokens from ``token_caches``."""
+    token_caches["access"].discard(request.cookies.get(authx_config.JWT_ACCESS_COOKIE_NAME))
+    token_caches["refresh"].discard(request.cookies.get(authx_config.JWT_REFRESH_COOKIE_NAME))
 
 
 DBSessionDep = Annotated[AsyncSession, Depends(get_async_session)]
-AuthDep = Annotated[TokenPayload, Depends(auth.access_token_required)]
-RefreshDep = Annotated[TokenPayload, Depends(auth.refresh_token_required)]
+AuthDep = Annotated[TokenPayload, Depends(access_token_required)]
+RefreshDep = Annotated[TokenPayload, Depends(refresh_token_required)]
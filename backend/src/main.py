@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from authx import AuthX
 from authx.exceptions import MissingTokenError, AuthXException
 from fastapi.middleware.cors import CORSMiddleware
@@ -7,11 +9,26 @@ from loguru import logger
 
 from src.auth.models import User
 from src.config import authx_config
+from src.database import engine, warm_up_pool
 from src.auth import router as auth_router
+from src.wb.dependencies import wb_lifespan
 from src.wb.routers import wb_router
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        await warm_up_pool()
+    except Exception as e:
+        logger.warning(f"Database pool warm-up failed: {e}")
+
+    async with wb_lifespan(app):
+        yield
+
+    await engine.dispose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.include_router(auth_router)
 app.include_router(wb_router)
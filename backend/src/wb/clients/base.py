@@ -11,6 +11,8 @@ class BaseApi:
 
     Provides common initialization and client access for all API classes.
     """
+    __slots__ = ("client",)
+
 
     def __init__(self, client: "APIClient") -> None:
         """
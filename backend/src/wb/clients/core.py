@@ -1,125 +1,153 @@
-import asyncio
-from abc import ABC
-from types import TracebackType
-from typing import Any, Optional, Type
+from typing import Any, Optional
 
 import httpx
+from pydantic_core import from_json
 
+from src.wb.clients.limiter import RateLimiter
 from src.wb.clients.orders import OrdersApi
-from src.wb.clients.urls import ExternalApiUrls
+from src.wb.clients import urls
 
 
 class FetchError(Exception):
     """Raised when an HTTP request fails."""
 
 
-class APIClient(ABC):
+def create_http_client(timeout: float = 10.0) -> httpx.AsyncClient:
+    """
+    Create the process-wide HTTP client for the Wildberries API.
+    
+    The client is meant to be created once at application startup and shared
+    by all APIClient instances, so TCP/TLS connections are kept alive across
+    requests.
+    
+    Args:
+        timeout: Request timeout in seconds. Applied to all HTTP operations.
+    
+    Returns:
+        Configured httpx.AsyncClient; the caller is responsible for closing it.
+    """
+    return httpx.AsyncClient(
+        base_url=urls.BASE_URL,
+        timeout=httpx.Timeout(timeout),
+        limits=httpx.Limits(max_keepalive_connections=100),
+    )
+
+
+class APIClient:
     """
     Asynchronous HTTP client for Wildberries Statistics API.
     
-    Manages HTTP connections, authentication, rate limiting, and provides access
-    to various API endpoint groups. Must be used as an async context manager.
+    Lightweight per-request facade over a shared httpx.AsyncClient that adds
+    authentication, rate limiting, and provides access to various API
+    endpoint groups.
     
     Attributes:
-        urls: Class containing all API endpoint URLs.
+        urls: Module containing all API endpoint URLs.
         orders: Property providing access to OrdersApi endpoints.
     
     Note:
-        - Must be used with 'async with' statement
-        - Rate limiting is controlled via semaphore
+        - The underlying httpx client is owned by the application lifespan
+        - Rate limiting is controlled via a limiter shared across instances
         - All requests include automatic authorization headers
     """
+    __slots__ = (
+        "urls",
+        "_client",
+        "_limiter",
+        "_api_key",
+        "_default_headers",
+        "_orders",
+    )
+
     def __init__(
         self,
+        client: httpx.AsyncClient,
+        limiter: RateLimiter,
         api_key: str,
-        max_concurrent_requests: int = 10,
-        timeout: float = 10.0
     ):
         """
-        Initialize the API client with authentication and connection settings.
+        Initialize the API client with a shared HTTP client and credentials.
         
         Args:
+            client: Shared httpx.AsyncClient created by create_http_client.
+            limiter: Application-wide rate limiter for the Wildberries host.
             api_key: Wildberries API authorization token.
-            max_concurrent_requests: Maximum number of concurrent API requests allowed.
-                Prevents rate limiting by controlling parallel request count.
-            timeout: Request timeout in seconds. Applied to all HTTP operations.
         """
-        self.urls = ExternalApiUrls
+        self.urls = urls
 
-        self._client: Optional[httpx.AsyncClient] = None
-        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
-        self._timeout = timeout
+        self._client = client
+        self._limiter = limiter
         self._api_key = api_key
-
-
+        self._default_headers = {
+            "Authorization": api_key,
+            "Content-Type": "application/json",
+        }
 
         self._orders: Optional[OrdersApi] = None
 
-
-    async def __aenter__(self) -> "APIClient":
+    def get_default_headers(self) -> dict[str, Any]:
         """
-        Enter the async context manager and initialize HTTP client.
-        
-        Creates and configures the underlying httpx.AsyncClient with base URL
-        and timeout settings.
+        Get default HTTP headers for all API requests.
         
         Returns:
-            Self instance with initialized HTTP client.
+            Dictionary containing Authorization header with API key and
+            Content-Type set to application/json. Built once per client;
+            do not mutate.
         """
-        self._client = httpx.AsyncClient(
-            base_url=ExternalApiUrls.BASE_URL,
-            timeout=httpx.Timeout(self._timeout),
-        )
-        return self
+        return self._default_headers
 
-    async def __aexit__(
+    async def fetch(
         self,
-        exc_type: Optional[Type[BaseException]],
-        exc_val: Optional[BaseException],
-        exc_tb: Optional[TracebackType],
-    ):
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        body: Optional[dict[str, Any]] = None,
+        method: str = "POST",
+        headers: Optional[dict[str, Any]] = None,
+    ) -> Any:
         """
-        Exit the async context manager and cleanup resources.
+        Execute an HTTP request to the API and parse the JSON response.
         
-        Closes the HTTP client connection gracefully, ensuring all pending
-        requests are completed.
+        Thin wrapper over fetch_raw that parses the body bytes directly,
+        without decoding them to an intermediate str first; see fetch_raw
+        for rate limiting, header and error handling details.
         
         Args:
-            exc_type: Exception type if an error occurred, None otherwise.
-            exc_val: Exception instance if an error occurred, None otherwise.
-            exc_tb: Exception traceback if an error occurred, None otherwise.
-        """
-        if self._client:
-            await self._client.aclose()
-
-
-    def get_default_headers(self) -> dict[str, Any]:
-        """
-        Get default HTTP headers for all API requests.
+            url: API endpoint URL (relative to base URL or absolute).
+            params: Optional query parameters to include in the request.
+            body: Optional JSON body for POST/PUT requests.
+            method: HTTP method (GET, POST, PUT, DELETE, etc.). Defaults to POST.
+            headers: Optional additional headers to merge with defaults.
         
         Returns:
-            Dictionary containing Authorization header with API key and
-            Content-Type set to application/json.
+            Parsed JSON response as Python dictionary or list.
+        
+        Raises:
+            FetchError: If HTTP request fails due to network error or non-2xx status code.
         """
-        return {
-            "Authorization": self._api_key,
-            "Content-Type": "application/json",
-        }
+        raw = await self.fetch_raw(
+            url=url,
+            params=params,
+            body=body,
+            method=method,
+            headers=headers,
+        )
+        return from_json(raw)
 
-    async def fetch(
+    async def fetch_raw(
         self,
         url: str,
         params: Optional[dict[str, Any]] = None,
         body: Optional[dict[str, Any]] = None,
         method: str = "POST",
         headers: Optional[dict[str, Any]] = None,
-    ) -> Any:
+    ) -> bytes:
         """
         Execute an HTTP request to the API with rate limiting and error handling.
         
-        Performs rate-limited HTTP request with automatic header injection,
-        error handling, and JSON response parsing. Merges provided headers
-        with default authorization headers.
+        Performs rate-limited HTTP request with automatic header injection
+        and error handling, returning the undecoded response body. Use it to
+        feed the bytes straight into a typed JSON validator instead of
+        building an intermediate Python object tree.
         
         Args:
             url: API endpoint URL (relative to base URL or absolute).
@@ -129,23 +157,22 @@ class APIClient(ABC):
             headers: Optional additional headers to merge with defaults.
         
         Returns:
-            Parsed JSON response as Python dictionary or list.
+            Raw response body.
         
         Raises:
-            RuntimeError: If client is not initialized (used outside async context).
             FetchError: If HTTP request fails due to network error or non-2xx status code.
         
         Note:
-            - Rate limiting is enforced via internal semaphore
+            - Rate limiting is enforced via the shared limiter
             - Default headers (auth + content-type) are automatically included
             - Custom headers override defaults if keys conflict
         """
-        if not self._client:
-            raise RuntimeError("Client is not initialized. Use 'async with'.")
-
-        merged_headers = {**self.get_default_headers(), **(headers or {})}
+        merged_headers = (
+            self._default_headers if headers is None
+            else self._default_headers | headers
+        )
 
-        async with self._semaphore:
+        async with self._limiter:
             try:
                 resp = await self._client.request(
                     method=method.upper(),
@@ -155,7 +182,7 @@ class APIClient(ABC):
                     headers=merged_headers,
                 )
                 resp.raise_for_status()
-                return resp.json()
+                return resp.content
 
             except httpx.HTTPStatusError as e:
                 text = e.response.text
@@ -0,0 +1,61 @@
+import asyncio
+import time
+from types import TracebackType
+from typing import Optional, Type
+
+
+class RateLimiter:
+    """
+    Leaky-bucket rate limiter for outgoing API requests.
+
+    Allows up to ``max_rate`` acquisitions per ``time_period`` seconds.
+    A single instance is meant to be shared by every APIClient talking to
+    the same host, so the budget holds across concurrent requests.
+    Waiters are served in arrival order.
+
+    Usage:
+        limiter = RateLimiter(max_rate=300, time_period=60)
+        async with limiter:
+            await client.request(...)
+    """
+    def __init__(self, max_rate: float, time_period: float = 60.0) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            max_rate: Number of requests allowed per time period (bucket size).
+            time_period: Length of the time period in seconds.
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+
+        self._rate_per_sec = max_rate / time_period
+        self._level = 0.0
+        self._last_check = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _leak(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_check
+        self._level = max(self._level - elapsed * self._rate_per_sec, 0.0)
+        self._last_check = now
+
+    async def acquire(self) -> None:
+        """Wait until the bucket has capacity for one more request."""
+        async with self._lock:
+            self._leak()
+            while self._level + 1 > self.max_rate:
+                await asyncio.sleep((self._level + 1 - self.max_rate) / self._rate_per_sec)
+                self._leak()
+            self._level += 1
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        return None
@@ -1,9 +1,25 @@
 from typing import Optional
 
-from src.wb.schemas import DateRangeRequest, OrderItem, OrdersResponse
+from pydantic import TypeAdapter
+
+from src.wb.schemas import DateRangeRequest, OrderItem, OrderItemAnalytics
 from src.wb.clients.base import BaseApi
 
 
+_ORDERS_ADAPTER = TypeAdapter(list[OrderItem])
+_ORDERS_ANALYTICS_ADAPTER = TypeAdapter(list[OrderItemAnalytics])
+
+
+def parse_orders(raw: bytes) -> list[OrderItem]:
+    """Validate a raw orders response body into full OrderItem models."""
+    return _ORDERS_ADAPTER.validate_json(raw)
+
+
+def parse_orders_analytics(raw: bytes) -> list[OrderItemAnalytics]:
+    """Validate a raw orders response body into lean OrderItemAnalytics models."""
+    return _ORDERS_ANALYTICS_ADAPTER.validate_json(raw)
+
+
 class OrdersApi(BaseApi):
     """
     API client for Wildberries orders and statistics endpoints.
@@ -14,29 +30,48 @@ class OrdersApi(BaseApi):
     This class is accessed via the APIClient.orders property and should not be
     instantiated directly.
     """
-    async def get_orders(
+    __slots__ = ()
+
+    async def get_orders_raw(
         self,
         date: DateRangeRequest,
         flag: Optional[int] = 1,
-    )-> list[OrderItem]:
+    ) -> bytes:
         """
-        Fetch supplier orders from the external API.
+        Fetch supplier orders from the external API without parsing them.
 
-        Retrieves orders filtered by last modification date. The filtering behavior 
-        depends on the flag parameter.
+        Lets the caller pick how to validate the body, e.g. with
+        parse_orders_analytics on the request path and parse_orders later.
 
         Args:
             date: Date filter in YYYY-MM-DD format (RFC3339, UTC+3)
             flag: 0 = orders >= date (≤100k), 1 = exact date match (all)
 
         Returns:
-            OrdersResponse with the list of orders
+            Raw JSON response body
         """
-        response = await self.client.fetch(
+        return await self.client.fetch_raw(
             method="GET",
             url=self.client.urls.SUPPLIER_ORDERS,
             params={"dateFrom": date.date, "flag": flag}
         )
-        result = OrdersResponse.model_validate(response)
-        return result.root
 
+    async def get_orders(
+        self,
+        date: DateRangeRequest,
+        flag: Optional[int] = 1,
+    )-> list[OrderItem]:
+        """
+        Fetch supplier orders from the external API.
+
+        Retrieves orders filtered by last modification date. The filtering behavior 
+        depends on the flag parameter.
+
+        Args:
+            date: Date filter in YYYY-MM-DD format (RFC3339, UTC+3)
+            flag: 0 = orders >= date (≤100k), 1 = exact date match (all)
+
+        Returns:
+            List of validated orders, parsed straight from the response bytes
+        """
+        return parse_orders(await self.get_orders_raw(date=date, flag=flag))
@@ -3,7 +3,7 @@ FastAPI dependency injection configuration for Wildberries API integration.
 
 Provides reusable dependencies for:
 - API credentials management
-- APIClient lifecycle management
+- Shared HTTP client lifecycle and APIClient construction
 - Database session and API client aggregation
 
 Usage:
@@ -15,15 +15,37 @@ Usage:
         # Use ctx.db_session for database operations
 """
 
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Annotated, AsyncGenerator
+from functools import lru_cache
+from typing import Annotated, AsyncIterator
 
-from fastapi import Depends
+from fastapi import Depends, FastAPI, Request
 from pydantic import BaseModel
 
 from src.dependencies import DBSessionDep
 from src.config import WbSettings as Settings
-from src.wb.clients.core import APIClient
+from src.wb.clients.core import APIClient, create_http_client
+from src.wb.clients.limiter import RateLimiter
+
+
+@asynccontextmanager
+async def wb_lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Own the shared Wildberries HTTP client and rate limiter for the
+    application lifetime.
+    
+    Stores the client on ``app.state.wb_http_client`` so every request reuses
+    the same connection pool, and closes it on shutdown. The limiter on
+    ``app.state.wb_limiter`` keeps all requests within WB's request budget.
+    
+    Args:
+        app: FastAPI application instance.
+    """
+    async with create_http_client() as http_client:
+        app.state.wb_http_client = http_client
+        app.state.wb_limiter = RateLimiter(max_rate=300, time_period=60)
+        yield
 
 
 class Credentials(BaseModel):
@@ -35,12 +57,14 @@ class Credentials(BaseModel):
     """
     api_key: str
 
-def get_credentials():
+@lru_cache(maxsize=1)
+def get_credentials() -> Credentials:
     """
     Retrieve and validate Wildberries API credentials from settings.
     
     Loads API key from environment configuration and wraps it in a
-    Credentials object for dependency injection.
+    Credentials object for dependency injection. The result is cached,
+    so settings are read once per process instead of on every request.
     
     Returns:
         Credentials object containing the API key.
@@ -55,29 +79,31 @@ def get_credentials():
     
 
 async def get_client(
+    request: Request,
     creds: Credentials = Depends(get_credentials),
-) -> AsyncGenerator[APIClient, None]:
+) -> APIClient:
     """
-    Create and manage APIClient lifecycle for dependency injection.
+    Build an APIClient on top of the application's shared HTTP client.
     
-    Initializes an async context-managed APIClient with provided credentials
-    and yields it for use in FastAPI endpoints. Automatically handles cleanup
-    on request completion.
+    The returned client is a lightweight facade: it reuses the connection
+    pool and rate limiter created in wb_lifespan, so no TCP/TLS setup
+    happens per request and the rate limit applies process-wide.
     
     Args:
+        request: Incoming request, used to reach ``app.state``.
         creds: Validated API credentials from get_credentials dependency.
     
-    Yields:
+    Returns:
         Configured APIClient instance ready for making API requests.
     
     Note:
         Used via ApiClientDep annotation in FastAPI route handlers.
-        Client is automatically closed after request completion.
     """
-    async with APIClient(
+    return APIClient(
+        client=request.app.state.wb_http_client,
+        limiter=request.app.state.wb_limiter,
         api_key=creds.api_key,
-    ) as client:
-        yield client
+    )
 
 
 ApiClientDep = Annotated[APIClient, Depends(get_client)]
@@ -18,6 +18,7 @@ from src.database import int_pk, Base
 
 class Product(Base):
     """Normalized product/SKU information."""
+    __tablename__ = "products"
     __table_args__ = {"schema": "wb"}
     
     id: Mapped[int_pk]
@@ -34,6 +35,7 @@ class Product(Base):
 
 class Warehouse(Base):
     """Normalized warehouse information."""
+    __tablename__ = "warehouses"
     __table_args__ = {"schema": "wb"}
     
     id: Mapped[int_pk]
@@ -45,7 +47,7 @@ class Warehouse(Base):
 
 class Region(Base):
     """Normalized region/geography information."""
-    __table_args__ = {"schema": "wb"}
+    __tablename__ = "regions"
     
     id: Mapped[int_pk]
     country_name: Mapped[str] = mapped_column(String(255))
@@ -62,10 +64,17 @@ class Region(Base):
 
 class Order(Base):
     """Main order table with references to normalized entities."""
+    __tablename__ = "orders"
     __table_args__ = (
         Index("idx_orders_date", "date"),
-        Index("idx_orders_last_change_date", "last_change_date"),
-        Index("idx_orders_is_cancel", "is_cancel"),
+        # Covers "non-cancelled orders in a date window, revenue by product"
+        # as an index-only scan
+        Index(
+            "idx_orders_cancel_lcd",
+            "is_cancel",
+            "last_change_date",
+            postgresql_include=["product_id", "price_with_disc"],
+        ),
         Index("idx_orders_product_id", "product_id"),
         {"schema": "wb"},
     )
@@ -1,106 +1,253 @@
-from decimal import Decimal
+import asyncio
+from typing import Any, Hashable, Optional
 
+from loguru import logger
+from pydantic import ValidationError
+from pydantic_core import from_json
+from sqlalchemy import any_, bindparam, func, select, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database import async_session_maker
+from src.wb.clients.orders.api import parse_orders
 from src.wb.schemas import OrderItem
 
 from .orders import Order, Product, Warehouse, Region
 
-def create_order_from_item(order_item, session) -> Order:
+
+ORDER_UPDATE_COLUMNS = (
+    "last_change_date",
+    "cancel_date",
+    "is_supply",
+    "is_realization",
+    "is_cancel",
+    "total_price",
+    "discount_percent",
+    "spp",
+    "finished_price",
+    "price_with_disc",
+    "sticker",
+    "g_number",
+)
+
+
+async def resolve_ids(
+    session: AsyncSession,
+    model: Any,
+    key_columns: tuple[str, ...],
+    rows: dict[Hashable, dict[str, Any]],
+) -> dict[Hashable, int]:
     """
-    Convert Pydantic OrderItem to SQLAlchemy ORM Order with normalized relations.
-    
+    Look up dimension rows in bulk, insert the missing ones and return their primary keys.
+
+    One SELECT fetches the rows that already exist; only
+    the keys it did not find go into a single INSERT ... ON CONFLICT DO
+    NOTHING RETURNING. Keys inserted concurrently by another writer
+    (skipped by the insert) are picked up by a final SELECT.
+
+    Single-column keys are matched with ``= ANY(:keys)``, which sends the
+    whole key list as one array parameter regardless of its size.
+
     Args:
-        order_item: Pydantic OrderItem instance
-        session: SQLAlchemy session for database operations
-    
+        session: Async SQLAlchemy session.
+        model: ORM model of the dimension table (Product, Warehouse, Region).
+        key_columns: Names of the columns forming the natural key.
+        rows: Column values to insert, keyed by natural key. Single-column
+            keys are plain values, composite keys are tuples in
+            key_columns order.
+
     Returns:
-        Order ORM instance (not yet added to session)
+        Mapping of natural key to primary key for every key in rows.
     """
-    from sqlalchemy import select
-    
-    product = session.scalar(
-        select(Product).where(Product.nm_id == order_item.nm_id)
-    )
-    if not product:
-        product = Product(
-            nm_id=order_item.nm_id,
-            barcode=order_item.barcode,
-            supplier_article=order_item.supplier_article,
-            category=order_item.category,
-            subject=order_item.subject,
-            brand=order_item.brand,
-            tech_size=order_item.tech_size,
-        )
-        session.add(product)
-        session.flush()
-    
-    warehouse = session.scalar(
-        select(Warehouse).where(Warehouse.name == order_item.warehouse_name)
-    )
-    if not warehouse:
-        warehouse = Warehouse(
-            name=order_item.warehouse_name,
-            warehouse_type=order_item.warehouse_type,
-        )
-        session.add(warehouse)
-        session.flush()
-    
-    region = session.scalar(
-        select(Region).where(
-            Region.country_name == order_item.country_name,
-            Region.oblast_okrug_name == order_item.oblast_okrug_name,
-            Region.region_name == order_item.region_name,
-        )
-    )
-    if not region:
-        region = Region(
-            country_name=order_item.country_name,
-            oblast_okrug_name=order_item.oblast_okrug_name,
-            region_name=order_item.region_name,
+    ids: dict[Hashable, int] = {}
+    if not rows:
+        return ids
+
+    columns = [getattr(model, name) for name in key_columns]
+
+    def natural_key(row: Any) -> Hashable:
+        values = tuple(getattr(row, name) for name in key_columns)
+        return values if len(values) > 1 else values[0]
+
+    async def select_existing(keys: list[Hashable]) -> None:
+        if len(columns) > 1:
+            condition = tuple_(*columns).in_(keys)
+        else:
+            condition = columns[0] == any_(
+                bindparam("keys", keys, type_=ARRAY(columns[0].type))
+            )
+        existing = await session.execute(select(model.id, *columns).where(condition))
+        ids.update({natural_key(row): row.id for row in existing})
+
+    await select_existing(list(rows))
+
+    new_rows = [row for key, row in rows.items() if key not in ids]
+    if new_rows:
+        inserted = await session.execute(
+            pg_insert(model)
+            .on_conflict_do_nothing()
+            .returning(model.id, *columns),
+            new_rows,
         )
-        session.add(region)
-        session.flush()
-    
-    order = Order(
-        srid=order_item.srid,
-        date=order_item.date,
-        last_change_date=order_item.last_change_date,
-        cancel_date=order_item.cancel_date,
-        product_id=product.id,
-        warehouse_id=warehouse.id,
-        region_id=region.id,
-        income_id=order_item.income_id,
-        is_supply=order_item.is_supply,
-        is_realization=order_item.is_realization,
-        is_cancel=order_item.is_cancel,
-        total_price=Decimal(str(order_item.total_price)),
-        discount_percent=order_item.discount_percent,
-        spp=Decimal(str(order_item.spp)),
-        finished_price=Decimal(str(order_item.finished_price)),
-        price_with_disc=Decimal(str(order_item.price_with_disc)),
-        sticker=order_item.sticker,
-        g_number=order_item.g_number,
-    )
-    
-    return order
-
-
-async def save_orders_to_db(orders: list[OrderItem], db_session):
+        ids.update({natural_key(row): row.id for row in inserted})
+
+        missing = [key for key in rows if key not in ids]
+        if missing:
+            await select_existing(missing)
+
+    return ids
+
+
+async def save_orders_to_db(orders: list[OrderItem]) -> None:
     """
     Background task to save orders to database.
-    
+
+    Opens its own session (the request-scoped one is already closed when
+    background tasks run) and writes the whole batch in a single
+    transaction: either every order lands or none does.
+
+    Resolves products, warehouses and regions with one bulk lookup and
+    insert each (ids are resolved per call, never cached across batches,
+    so they cannot go stale), then writes all orders in a single batched INSERT ... ON CONFLICT
+    (srid) DO UPDATE, so a batch costs a handful of round-trips instead
+    of several per order. Orders seen before are refreshed with their
+    latest state (e.g. cancellation).
+
     Args:
         orders: List of order items to save
-        db_session: Database session for saving
     """
     try:
-        for order_item in orders:
-            order = create_order_from_item(order_item, db_session)
-            db_session.add(order)
-        
-        await db_session.commit()
-        print(f"Successfully saved {len(orders)} orders to database")
+        async with async_session_maker() as db_session, db_session.begin():
+            products: dict[Hashable, dict[str, Any]] = {}
+            warehouses: dict[Hashable, dict[str, Any]] = {}
+            regions: dict[Hashable, dict[str, Any]] = {}
+            latest: dict[str, OrderItem] = {}
+
+            for item in orders:
+                products.setdefault(item.nm_id, {
+                    "nm_id": item.nm_id,
+                    "barcode": item.barcode,
+                    "supplier_article": item.supplier_article,
+                    "category": item.category,
+                    "subject": item.subject,
+                    "brand": item.brand,
+                    "tech_size": item.tech_size,
+                })
+                warehouses.setdefault(item.warehouse_name, {
+                    "name": item.warehouse_name,
+                    "warehouse_type": item.warehouse_type,
+                })
+                region_key = (item.country_name, item.oblast_okrug_name, item.region_name)
+                regions.setdefault(region_key, {
+                    "country_name": item.country_name,
+                    "oblast_okrug_name": item.oblast_okrug_name,
+                    "region_name": item.region_name,
+                })
+                # One statement cannot upsert the same srid twice; keep the latest state
+                seen = latest.get(item.srid)
+                if seen is None or item.last_change_date >= seen.last_change_date:
+                    latest[item.srid] = item
+
+            product_ids = await resolve_ids(
+                db_session, Product, ("nm_id",), products
+            )
+            warehouse_ids = await resolve_ids(
+                db_session, Warehouse, ("name",), warehouses
+            )
+            region_ids = await resolve_ids(
+                db_session,
+                Region,
+                ("country_name", "oblast_okrug_name", "region_name"),
+                regions,
+            )
+
+            order_rows = [
+                {
+                    "srid": item.srid,
+                    "date": item.date,
+                    "last_change_date": item.last_change_date,
+                    "cancel_date": item.cancel_date,
+                    "product_id": product_ids[item.nm_id],
+                    "warehouse_id": warehouse_ids[item.warehouse_name],
+                    "region_id": region_ids[
+                        (item.country_name, item.oblast_okrug_name, item.region_name)
+                    ],
+                    "income_id": item.income_id,
+                    "is_supply": item.is_supply,
+                    "is_realization": item.is_realization,
+                    "is_cancel": item.is_cancel,
+                    "total_price": item.total_price,
+                    "discount_percent": item.discount_percent,
+                    "spp": item.spp,
+                    "finished_price": item.finished_price,
+                    "price_with_disc": item.price_with_disc,
+                    "sticker": item.sticker,
+                    "g_number": item.g_number,
+                }
+                for item in latest.values()
+            ]
+
+            if order_rows:
+                stmt = pg_insert(Order)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[Order.srid],
+                    set_={
+                        **{name: stmt.excluded[name] for name in ORDER_UPDATE_COLUMNS},
+                        "updated_at": func.now(),
+                    },
+                )
+                await db_session.execute(stmt, order_rows)
+
+        logger.info(f"Saved {len(orders)} orders to database")
     except Exception as e:
-        await db_session.rollback()
-        print(f"Error saving orders to database: {e}")
-    finally:
-        await db_session.close()
+        logger.exception(f"Error saving orders to database: {e}")
+
+
+def _parse_valid_orders(raw: bytes, count: int) -> list[OrderItem]:
+    """
+    Parse the leading `count` orders into full OrderItem models.
+
+    Falls back to validating orders one by one when the batch does not
+    parse as a whole, so that a few invalid orders do not drop the rest;
+    the rejected ones are logged at error level.
+    """
+    try:
+        return parse_orders(raw)[:count]
+    except ValidationError:
+        pass
+
+    orders: list[OrderItem] = []
+    first_error: Optional[ValidationError] = None
+    for item in from_json(raw)[:count]:
+        try:
+            orders.append(OrderItem.model_validate(item))
+        except ValidationError as e:
+            first_error = first_error or e
+
+    if first_error is not None:
+        logger.error(
+            f"{count - len(orders)} of {count} WB orders failed validation "
+            f"and were not saved; first error: {first_error}"
+        )
+    return orders
+
+
+async def save_raw_orders_to_db(raw: bytes, count: int) -> None:
+    """
+    Background task to parse a raw WB orders response and save it to database.
+
+    The request path only parses the lean OrderItemAnalytics view; the full
+    OrderItem models the writer needs are built here, after the response
+    has been sent. Parsing is CPU-bound, so it runs in a worker thread to
+    keep the event loop serving other requests. If some orders fail full
+    validation, the valid ones are still saved and the rejected ones are
+    logged at error level.
+
+    Args:
+        raw: Raw JSON body of the WB orders response
+        count: Number of leading orders to save (the rest fall outside the
+            requested date range)
+    """
+    orders = await asyncio.to_thread(_parse_valid_orders, raw, count)
+    if orders:
+        await save_orders_to_db(orders)
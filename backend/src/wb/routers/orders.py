@@ -1,10 +1,13 @@
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from datetime import datetime, time, timedelta
+from operator import attrgetter
 from fastapi import APIRouter, BackgroundTasks, HTTPException, status
 
 from src.wb.dependencies import ContextDep
 from src.wb.services.abc_analytics import calculate_abc_analysis
 from src.wb.schemas import ABCItem, DateRange
-from src.wb.models.utils import save_orders_to_db
+from src.wb.clients.orders.api import parse_orders_analytics
+from src.wb.models.utils import save_raw_orders_to_db
 
 router = APIRouter(tags=["wb-orders"])
 
@@ -44,9 +47,7 @@ async def get_orders(
         - Orders are saved to database asynchronously after response
     """
     current_date = datetime.now().date()
-    date_from_dt = datetime.strptime(date_range.date_from.date, "%Y-%m-%d").date()
-    
-    days_diff = (current_date - date_from_dt).days
+    days_diff = (current_date - date_range.date_from.parsed).days
     
     if days_diff > 90:
         raise HTTPException(
@@ -55,12 +56,17 @@ async def get_orders(
         )
 
     if date_range.date_to:
-        orders_response = await ctx.client.orders.get_orders(date=date_range.date_from, flag=0)
-        date_to_end = datetime.strptime(date_range.date_to.date, "%Y-%m-%d") + timedelta(days=1, seconds=-1)
+        raw = await ctx.client.orders.get_orders_raw(date=date_range.date_from, flag=0)
+        orders_response = parse_orders_analytics(raw)
+        date_to_end = datetime.combine(date_range.date_to.parsed, time()) + timedelta(days=1, seconds=-1)
         
-        orders = [order for order in orders_response if order.last_change_date <= date_to_end]
+        # WB returns orders sorted by lastChangeDate (the API paginates on it),
+        # so the range end is a binary search instead of a full scan
+        cut = bisect_right(orders_response, date_to_end, key=attrgetter("last_change_date"))
+        orders = orders_response[:cut]
     else:
-        orders = await ctx.client.orders.get_orders(date=date_range.date_from)
+        raw = await ctx.client.orders.get_orders_raw(date=date_range.date_from)
+        orders = parse_orders_analytics(raw)
 
     if not orders:
         raise HTTPException(
@@ -70,6 +76,6 @@ async def get_orders(
 
     abc_result: list[ABCItem]  = await calculate_abc_analysis(orders)
 
-    background_tasks.add_task(save_orders_to_db, orders, ctx.db_session)
+    background_tasks.add_task(save_raw_orders_to_db, raw, len(orders))
 
     return abc_result
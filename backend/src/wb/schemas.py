@@ -4,10 +4,11 @@ Pydantic schemas for Wildberries API requests and responses.
 Defines data models for orders, errors, date ranges, and ABC analysis results.
 All models use camelCase for API compatibility via alias_generator.
 """
-from datetime import datetime
+from datetime import date as date_type, datetime
+from decimal import Decimal
 from typing import Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, RootModel, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, RootModel, field_validator, model_validator
 from pydantic.alias_generators import to_camel
 
 
@@ -50,6 +51,8 @@ class OrderItem(BaseModel):
     Note:
         Field names are automatically converted to camelCase for API compatibility.
         Use populate_by_name=True to accept both snake_case and camelCase.
+        Money fields are Decimal, parsed once from the JSON number text, so they
+        can be written to Numeric columns without further conversion.
     """
     date: datetime
     last_change_date: datetime
@@ -68,11 +71,11 @@ class OrderItem(BaseModel):
     income_id: int = Field(..., alias="incomeID")
     is_supply: bool
     is_realization: bool
-    total_price: float
+    total_price: Decimal
     discount_percent: int
-    spp: float
-    finished_price: float
-    price_with_disc: float
+    spp: Decimal
+    finished_price: Decimal
+    price_with_disc: Decimal
     is_cancel: bool
     cancel_date: datetime
     sticker: str
@@ -82,6 +85,39 @@ class OrderItem(BaseModel):
     model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
 
 
+class OrderItemAnalytics(BaseModel):
+    """
+    Lean view of an order record with only the fields ABC analysis needs.
+    
+    Parsed from the same Wildberries response as OrderItem; all other keys
+    are skipped, so the response path builds far fewer objects. The full
+    OrderItem is parsed later for the database writer.
+    
+    Unlike OrderItem, price_with_disc is a float: analytics sums in float,
+    and building a Decimal per order only to convert it back is wasted work.
+    
+    Attributes:
+        last_change_date: Last modification date and time (used for filtering).
+        supplier_article: Seller's SKU/article number.
+        nm_id: Wildberries product identifier (nomenclature ID).
+        barcode: Product barcode (EAN/UPC).
+        subject: Product subject/type (e.g., "T-Shirts", "Sneakers").
+        brand: Product brand name.
+        price_with_disc: Price after discount (used for revenue calculations).
+        is_cancel: Whether order was cancelled.
+    """
+    last_change_date: datetime
+    supplier_article: str
+    nm_id: int
+    barcode: str
+    subject: str
+    brand: str
+    price_with_disc: float
+    is_cancel: bool
+
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+
 class OrdersResponse(RootModel):
     """
     API response wrapper for orders list.
@@ -163,16 +199,20 @@ class DateRangeRequest(BaseModel):
     Date parameter for API requests with validation.
     
     Validates date string format and ensures it matches YYYY-MM-DD pattern
-    required by the Wildberries API.
+    required by the Wildberries API. The string is parsed once during
+    validation and the result is kept on the model.
     
     Attributes:
         date: Date string in YYYY-MM-DD format (e.g., "2024-01-15").
+        parsed: The same date as a ``datetime.date``.
     
     Raises:
         ValueError: If date string doesn't match YYYY-MM-DD format.
     """
     date: str
 
+    _parsed: date_type = PrivateAttr()
+
     @field_validator("date")
     @classmethod
     def validate_date_format(cls, v: str) -> str:
@@ -194,6 +234,18 @@ class DateRangeRequest(BaseModel):
         except ValueError:
             raise ValueError('Дата должна быть в формате YYYY-MM-DD (например, 2019-06-20)')
 
+    @model_validator(mode="after")
+    def store_parsed_date(self) -> "DateRangeRequest":
+        """Store the validated date as a ``datetime.date``."""
+        # The format is already checked, so splitting on "-" is exact
+        self._parsed = date_type(*map(int, self.date.split("-")))
+        return self
+
+    @property
+    def parsed(self) -> date_type:
+        """Date parsed from ``date`` during validation."""
+        return self._parsed
+
 
 class DateRange(BaseModel):
     """
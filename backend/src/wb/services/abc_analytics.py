@@ -1,11 +1,12 @@
-from collections import defaultdict
-from typing import Literal
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterable, Literal
 
-from src.wb.schemas import ABCItem, OrderItem
+from src.wb.schemas import ABCItem, OrderItem, OrderItemAnalytics
 
 
 async def calculate_abc_analysis(
-    orders: list[OrderItem],
+    orders: Iterable[OrderItem | OrderItemAnalytics],
     *,
     threshold_a: float = 80.0,
     threshold_b: float = 95.0,
@@ -20,7 +21,8 @@ async def calculate_abc_analysis(
     threshold_b%, and C the remaining products.
     
     Args:
-        orders: List of orders to analyze.
+        orders: Orders to analyze (full or lean models); any iterable,
+            consumed in a single pass.
         threshold_a: Cumulative revenue share threshold for category A in percent.
             Products up to this threshold are marked as 'A'. Defaults to 80.0.
         threshold_b: Cumulative revenue share threshold for category B in percent.
@@ -41,35 +43,32 @@ async def calculate_abc_analysis(
         - All percentage values are rounded to 2 decimal places
         - Category assignment is based on sorted cumulative revenue contribution
     """
-    filtered_orders = [
-        order for order in orders 
-        if not (exclude_cancelled and order.is_cancel)
-    ]
-    
-    if not filtered_orders:
-        return []
-    
-    aggregated: dict[int, dict] = defaultdict(lambda: {
-        "supplier_article": "",
-        "barcode": "",
-        "subject": "",
-        "brand": "",
-        "orders_count": 0,
-        "revenue": 0.0,
-    })
+    aggregated: dict[int, dict] = {}
+    total_revenue = 0.0
     
-    for order in filtered_orders:
-        item = aggregated[order.nm_id]
-        if not item["supplier_article"]:
-            item["supplier_article"] = order.supplier_article
-            item["barcode"] = order.barcode
-            item["subject"] = order.subject
-            item["brand"] = order.brand
+    for order in orders:
+        if exclude_cancelled and order.is_cancel:
+            continue
+        
+        price = float(order.price_with_disc)
+        total_revenue += price
+        
+        item = aggregated.get(order.nm_id)
+        if item is None:
+            item = aggregated[order.nm_id] = {
+                "supplier_article": order.supplier_article,
+                "barcode": order.barcode,
+                "subject": order.subject,
+                "brand": order.brand,
+                "orders_count": 0,
+                "revenue": 0.0,
+            }
         
         item["orders_count"] += 1
-        item["revenue"] += order.price_with_disc
+        item["revenue"] += price
     
-    total_revenue = sum(item["revenue"] for item in aggregated.values())
+    if not aggregated:
+        return []
     
     if total_revenue == 0:
         return []
@@ -80,21 +79,21 @@ async def calculate_abc_analysis(
         reverse=True
     )
     
-    result: list[ABCItem] = []
-    cumulative_share = 0.0
+    inv_total = 100.0 / total_revenue
+    shares = [data["revenue"] * inv_total for _, data in sorted_items]
+    cumulative = list(accumulate(shares))
     
-    for nm_id, data in sorted_items:
-        revenue_share = (data["revenue"] / total_revenue) * 100
-        cumulative_share += revenue_share
-        
-        if cumulative_share <= threshold_a:
-            category: Literal["A", "B", "C"] = "A"
-        elif cumulative_share <= threshold_b:
-            category = "B"
-        else:
-            category = "C"
-        
-        result.append(ABCItem(
+    # Cumulative shares are non-decreasing, so each category is a contiguous
+    # run: A ends after the last share <= threshold_a, B after the last <= threshold_b
+    cut_a = bisect_right(cumulative, threshold_a)
+    cut_b = bisect_right(cumulative, threshold_b, lo=cut_a)
+    categories: list[Literal["A", "B", "C"]] = (
+        ["A"] * cut_a + ["B"] * (cut_b - cut_a) + ["C"] * (len(cumulative) - cut_b)
+    )
+    
+    # Values are computed here and already type-correct; skip validation
+    return [
+        ABCItem.model_construct(
             supplier_article=data["supplier_article"],
             nm_id=nm_id,
             barcode=data["barcode"],
@@ -103,8 +102,9 @@ async def calculate_abc_analysis(
             category=category,
             orders_count=data["orders_count"],
             revenue=round(data["revenue"], 2),
-            revenue_share=round(revenue_share, 2),
+            revenue_share=round(share, 2),
             cumulative_share=round(cumulative_share, 2),
-        ))
-    
-    return result
+        )
+        for (nm_id, data), share, cumulative_share, category
+        in zip(sorted_items, shares, cumulative, categories)
+    ]
@@ -0,0 +1,14 @@
+import os
+
+from cryptography.fernet import Fernet
+
+
+# Settings are read at import time of src.config; provide dummies so the
+# modules import without a .env file.
+os.environ.setdefault("POSTGRES_HOST", "localhost")
+os.environ.setdefault("POSTGRES_PORT", "5432")
+os.environ.setdefault("POSTGRES_DB", "test")
+os.environ.setdefault("POSTGRES_USER", "test")
+os.environ.setdefault("POSTGRES_PASSWORD", "test")
+os.environ.setdefault("SECRET", Fernet.generate_key().decode())
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret-key-" + "x" * 32)
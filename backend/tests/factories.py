@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+from typing import Any
+
+
+BASE_DATE = datetime(2025, 8, 1, 10, 0)
+
+
+def make_wb_order(index: int, **overrides: Any) -> dict[str, Any]:
+    """Build one order in the Wildberries API (camelCase) shape."""
+    nm_id = overrides.pop("nmId", 1000 + index % 7)
+    changed_at = (BASE_DATE + timedelta(minutes=index)).isoformat()
+    order = {
+        "date": changed_at,
+        "lastChangeDate": changed_at,
+        "warehouseName": "Коледино",
+        "warehouseType": "Склад WB",
+        "countryName": "Россия",
+        "oblastOkrugName": "Центральный федеральный округ",
+        "regionName": "Московская область",
+        "supplierArticle": f"art-{nm_id}",
+        "nmId": nm_id,
+        "barcode": f"bc-{nm_id}",
+        "category": "Одежда",
+        "subject": "Футболки",
+        "brand": "Brand",
+        "techSize": "M",
+        "incomeID": 1,
+        "isSupply": False,
+        "isRealization": True,
+        "totalPrice": 1500.0,
+        "discountPercent": 20,
+        "spp": 5.0,
+        "finishedPrice": 1140.0,
+        "priceWithDisc": 1200.0 + (index % 5) * 10.5,
+        "isCancel": index % 10 == 0,
+        "cancelDate": "0001-01-01T00:00:00",
+        "sticker": "",
+        "gNumber": f"g-{index}",
+        "srid": f"srid-{index}",
+    }
+    order.update(overrides)
+    return order
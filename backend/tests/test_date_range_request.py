@@ -0,0 +1,21 @@
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+
+from src.wb.schemas import DateRangeRequest, DateRange
+
+
+def test_parsed_date_is_stored():
+    assert DateRangeRequest(date="2019-06-20").parsed == date(2019, 6, 20)
+    assert DateRangeRequest(date="2019-6-2").parsed == date(2019, 6, 2)
+
+
+@pytest.mark.parametrize("value", ["20.06.2019", "2019-13-01", "2019-02-30", ""])
+def test_invalid_date_is_reported_on_date_field(value: str):
+    with pytest.raises(ValidationError) as exc_info:
+        DateRange(date_from={"date": value}, date_to=None)
+
+    (error,) = exc_info.value.errors()
+    assert error["loc"] == ("date_from", "date")
+    assert "YYYY-MM-DD" in error["msg"]
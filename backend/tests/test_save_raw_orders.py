@@ -0,0 +1,82 @@
+import asyncio
+import json
+import threading
+
+import pytest
+from loguru import logger
+
+from src.wb.models import utils
+from src.wb.schemas import OrderItem
+from tests.factories import make_wb_order
+
+
+@pytest.fixture
+def saved(monkeypatch: pytest.MonkeyPatch) -> list[list[OrderItem]]:
+    calls: list[list[OrderItem]] = []
+
+    async def fake_save(orders: list[OrderItem]) -> None:
+        calls.append(orders)
+
+    monkeypatch.setattr(utils, "save_orders_to_db", fake_save)
+    return calls
+
+
+def test_saves_leading_orders(saved):
+    raw = json.dumps([make_wb_order(i) for i in range(5)]).encode()
+
+    asyncio.run(utils.save_raw_orders_to_db(raw, 3))
+
+    assert [o.srid for o in saved[0]] == ["srid-0", "srid-1", "srid-2"]
+
+
+def test_invalid_orders_do_not_drop_the_batch(saved):
+    orders = [make_wb_order(i) for i in range(4)]
+    orders[1]["warehouseType"] = "Склад СЦ"
+    raw = json.dumps(orders).encode()
+
+    asyncio.run(utils.save_raw_orders_to_db(raw, 4))
+
+    assert [o.srid for o in saved[0]] == ["srid-0", "srid-2", "srid-3"]
+
+
+def test_invalid_orders_outside_the_range_are_ignored(saved):
+    orders = [make_wb_order(i) for i in range(4)]
+    orders[3]["warehouseType"] = "Склад СЦ"
+    raw = json.dumps(orders).encode()
+
+    asyncio.run(utils.save_raw_orders_to_db(raw, 3))
+
+    assert [o.srid for o in saved[0]] == ["srid-0", "srid-1", "srid-2"]
+
+
+def test_parsing_runs_off_the_event_loop(saved, monkeypatch: pytest.MonkeyPatch):
+    parse_threads: list[threading.Thread] = []
+    parse_orders = utils.parse_orders
+
+    def tracking_parse(raw: bytes) -> list[OrderItem]:
+        parse_threads.append(threading.current_thread())
+        return parse_orders(raw)
+
+    monkeypatch.setattr(utils, "parse_orders", tracking_parse)
+    raw = json.dumps([make_wb_order(i) for i in range(2)]).encode()
+
+    asyncio.run(utils.save_raw_orders_to_db(raw, 2))
+
+    assert parse_threads and parse_threads[0] is not threading.main_thread()
+    assert len(saved[0]) == 2
+
+
+def test_save_failure_is_logged_with_traceback(monkeypatch: pytest.MonkeyPatch):
+    def broken_session_maker():
+        raise KeyError(1000)
+
+    monkeypatch.setattr(utils, "async_session_maker", broken_session_maker)
+    messages: list[str] = []
+    handler_id = logger.add(messages.append, level="ERROR")
+    try:
+        asyncio.run(utils.save_orders_to_db([]))
+    finally:
+        logger.remove(handler_id)
+
+    assert "Error saving orders to database" in messages[0]
+    assert "Traceback" in messages[0]
@@ -0,0 +1,61 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import src.auth  # noqa: F401  (import before src.dependencies, as src.main does)
+from src.dependencies import AuthDep, RefreshDep, auth, token_caches
+
+
+@pytest.fixture
+def client() -> TestClient:
+    for cache in token_caches.values():
+        cache._entries.clear()
+
+    app = FastAPI()
+    auth.handle_errors(app)
+
+    @app.get("/access")
+    async def access(payload: AuthDep):
+        return {"sub": payload.sub, "type": payload.type}
+
+    @app.get("/refresh")
+    async def refresh(payload: RefreshDep):
+        return {"sub": payload.sub, "type": payload.type}
+
+    return TestClient(app)
+
+
+def test_access_token_is_cached(client: TestClient):
+    token = auth.create_access_token(uid="u1")
+    client.cookies.set("access_token", token)
+
+    assert client.get("/access").json() == {"sub": "u1", "type": "access"}
+    assert token_caches["access"].get(token) is not None
+    assert client.get("/access").json() == {"sub": "u1", "type": "access"}
+
+
+def test_cached_refresh_token_is_rejected_as_access_token(client: TestClient):
+    refresh_token = auth.create_refresh_token(uid="u1")
+
+    client.cookies.set("refresh_token", refresh_token)
+    assert client.get("/refresh").json() == {"sub": "u1", "type": "refresh"}
+    assert token_caches["refresh"].get(refresh_token) is not None
+
+    client.cookies.clear()
+    client.cookies.set("access_token", refresh_token)
+    response = client.get("/access")
+
+    assert response.status_code == 401
+    assert token_caches["access"].get(refresh_token) is None
+
+
+def test_cached_access_token_is_rejected_as_refresh_token(client: TestClient):
+    access_token = auth.create_access_token(uid="u1")
+
+    client.cookies.set("access_token", access_token)
+    assert client.get("/access").status_code == 200
+
+    client.cookies.clear()
+    client.cookies.set("refresh_token", access_token)
+
+    assert client.get("/refresh").status_code == 401
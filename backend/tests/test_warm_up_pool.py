@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from src import database
+
+
+class FakeConnection:
+    def __init__(self, behaviour: str):
+        self.behaviour = behaviour
+        self.closed = False
+
+    async def start(self) -> "FakeConnection":
+        if self.behaviour == "fail":
+            raise ConnectionError("connection refused")
+        if self.behaviour == "hang":
+            await asyncio.Event().wait()
+        return self
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeEngine:
+    def __init__(self, behaviours: list[str]):
+        self.connections = [FakeConnection(b) for b in behaviours]
+        self._pending = iter(self.connections)
+
+    def connect(self) -> FakeConnection:
+        return next(self._pending)
+
+
+@pytest.fixture
+def fake_engine(monkeypatch: pytest.MonkeyPatch):
+    def install(behaviours: list[str]) -> FakeEngine:
+        engine = FakeEngine(behaviours)
+        monkeypatch.setattr(database, "engine", engine)
+        return engine
+
+    return install
+
+
+def opened(engine: FakeEngine) -> list[FakeConnection]:
+    return [c for c in engine.connections if c.behaviour == "ok"]
+
+
+def test_connections_are_returned_to_pool(fake_engine):
+    engine = fake_engine(["ok"] * 3)
+
+    asyncio.run(database.warm_up_pool(size=3))
+
+    assert all(c.closed for c in engine.connections)
+
+
+def test_failure_closes_opened_connections(fake_engine):
+    engine = fake_engine(["ok", "fail", "hang", "ok"])
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(database.warm_up_pool(size=4, timeout=1.0))
+
+    assert all(c.closed for c in opened(engine))
+
+
+def test_timeout_bounds_startup(fake_engine):
+    engine = fake_engine(["ok", "hang", "ok"])
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(database.warm_up_pool(size=3, timeout=0.05))
+
+    assert all(c.closed for c in opened(engine))